@@ -9,16 +9,67 @@ This function requires S3 and DynamoDB access.
 import json
 import logging
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 import boto3
+from boto3.dynamodb.types import TypeSerializer
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+# The runtime configures the root logger itself when a log level is set on the function
+if 'AWS_LAMBDA_LOG_LEVEL' not in os.environ:
+    logger.setLevel(logging.INFO)
 
-# Initialize AWS clients
-s3_client = boto3.client('s3')
-dynamodb = boto3.resource('dynamodb')
+# Prefer orjson for response serialization when it is packaged with the function
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':'))
+
+# Keep connections alive between warm invocations to avoid repeated TLS handshakes
+_boto_config = Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={'mode': 'standard', 'max_attempts': 3}
+)
+
+# AWS clients are created on first use, so cold starts that fail validation
+# (or never reach DynamoDB) skip loading the unused service models
+_s3_client = None
+_dynamodb_client = None
+
+# Event fields that must be present and non-empty
+_REQUIRED_FIELDS = ('bucket', 'key')
+
+# Marshals plain Python values into DynamoDB attribute values for put_item
+_serialize = TypeSerializer().serialize
+
+
+def _get_s3_client():
+    """Return the shared S3 client, creating it on first use."""
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client('s3', config=_boto_config)
+    return _s3_client
+
+
+def _get_dynamodb_client():
+    """Return the shared DynamoDB client, creating it on first use."""
+    global _dynamodb_client
+    if _dynamodb_client is None:
+        _dynamodb_client = boto3.client('dynamodb', config=_boto_config)
+    return _dynamodb_client
+
+
+# With provisioned concurrency INIT runs ahead of any request, so build the clients
+# (service model loading, endpoint resolution) there instead of on the first invoke
+if os.environ.get('AWS_LAMBDA_INITIALIZATION_TYPE') == 'provisioned-concurrency':
+    _get_s3_client()
+    _get_dynamodb_client()
 
 
 def lambda_handler(event, context):
@@ -42,18 +93,19 @@ def lambda_handler(event, context):
         ValueError: If required parameters are missing
         ClientError: If AWS API calls fail
     """
-    logger.info(f"Processing file upload event: {json.dumps(event)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Processing file upload event: %s", json.dumps(event))
 
     try:
         # Validate inputs
-        bucket = event.get("bucket")
-        key = event.get("key")
+        for field in _REQUIRED_FIELDS:
+            if not event.get(field):
+                raise ValueError(f"Missing required field: {field}")
+
+        bucket = event["bucket"]
+        key = event["key"]
         table_name = event.get("table_name") or os.environ.get("TABLE_NAME")
 
-        if not bucket:
-            raise ValueError("Missing required field: bucket")
-        if not key:
-            raise ValueError("Missing required field: key")
         if not table_name:
             raise ValueError("Missing required field: table_name or TABLE_NAME env var")
 
@@ -61,7 +113,7 @@ def lambda_handler(event, context):
         logger.info(f"Fetching metadata for s3://{bucket}/{key}")
 
         try:
-            s3_response = s3_client.head_object(Bucket=bucket, Key=key)
+            s3_response = _get_s3_client().head_object(Bucket=bucket, Key=key)
         except ClientError as e:
             if e.response['Error']['Code'] == '404':
                 raise ValueError(f"Object not found: s3://{bucket}/{key}")
@@ -71,14 +123,16 @@ def lambda_handler(event, context):
         file_size = s3_response['ContentLength']
         content_type = s3_response.get('ContentType', 'unknown')
         last_modified = s3_response['LastModified'].isoformat()
-        etag = s3_response['ETag'].strip('"')
+        # HeadObject returns the ETag wrapped in double quotes
+        etag = s3_response.get('ETag', '')
+        if etag[:1] == '"':
+            etag = etag[1:-1]
 
         logger.info(f"File metadata: size={file_size}, type={content_type}")
 
         # Store metadata in DynamoDB
         logger.info(f"Storing metadata in DynamoDB table: {table_name}")
 
-        table = dynamodb.Table(table_name)
         item = {
             'file_id': f"{bucket}/{key}",
             'bucket': bucket,
@@ -87,18 +141,21 @@ def lambda_handler(event, context):
             'content_type': content_type,
             'last_modified': last_modified,
             'etag': etag,
-            'processed_at': datetime.utcnow().isoformat(),
+            'processed_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
             'processed_by': context.function_name
         }
 
-        table.put_item(Item=item)
+        _get_dynamodb_client().put_item(
+            TableName=table_name,
+            Item={k: _serialize(v) for k, v in item.items()}
+        )
 
         logger.info(f"Successfully processed file: {bucket}/{key}")
 
         # Return success response
         return {
             "statusCode": 200,
-            "body": json.dumps({
+            "body": _dumps({
                 "success": True,
                 "file_id": item['file_id'],
                 "metadata": {
@@ -114,7 +171,7 @@ def lambda_handler(event, context):
         logger.error(f"Validation error: {str(e)}")
         return {
             "statusCode": 400,
-            "body": json.dumps({
+            "body": _dumps({
                 "success": False,
                 "error": str(e)
             })
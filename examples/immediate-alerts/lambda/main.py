@@ -8,9 +8,15 @@ single failure needs immediate attention.
 
 import json
 import logging
+import os
 
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+# The runtime configures the root logger itself when a log level is set on the function
+if "AWS_LAMBDA_LOG_LEVEL" not in os.environ:
+    logger.setLevel(logging.INFO)
+
+# Order fields that must be present and non-empty
+_REQUIRED_FIELDS = ("order_id", "amount")
 
 
 def lambda_handler(event, context):
@@ -31,15 +37,14 @@ def lambda_handler(event, context):
         ValueError: If order validation fails
         RuntimeError: If payment processing fails
     """
-    logger.info(f"Processing order request: {json.dumps(event)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Processing order request: %s", json.dumps(event))
 
     try:
         # Validate order data
-        if not event.get("order_id"):
-            raise ValueError("Missing required field: order_id")
-
-        if not event.get("amount"):
-            raise ValueError("Missing required field: amount")
+        for field in _REQUIRED_FIELDS:
+            if not event.get(field):
+                raise ValueError(f"Missing required field: {field}")
 
         amount = float(event["amount"])
         if amount <= 0:
@@ -1,14 +1,290 @@
+import json
 import logging
+import os
+import time
+from contextlib import contextmanager
 from pathlib import Path
+from string import Template
 from textwrap import dedent
 
+import orjson
 import pytest
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from infrahouse_core.logging import setup_logging
+from pytest_infrahouse import terraform_apply
 
 LOG = logging.getLogger(__name__)
 
+_TESTS_DIR = Path(__file__).resolve().parent
+_REPO_ROOT = _TESTS_DIR.parent
+
 setup_logging(LOG, debug=True, debug_botocore=False)
 
+# Concurrent operations per terraform apply/destroy (see terraform_parallelism)
+TERRAFORM_PARALLELISM = 30
+
+# Shared by the AWS client fixtures. Tests invoke Lambdas from several threads,
+# so the pool is larger than botocore's default of 10, and throttled calls are
+# retried with client-side rate limiting instead of failing the test.
+_BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+# Terraform file templates, dedented once at import.
+# string.Template placeholders use "$name"; Terraform's own "${...}" interpolation
+# only appears in the plain (non-template) snippets below.
+_TERRAFORM_TF_TEMPLATE = Template(
+    dedent(
+        """
+        terraform {
+          required_version = "~> 1.0"
+
+          required_providers {
+            aws = {
+              source  = "hashicorp/aws"
+              version = "$aws_provider_version"
+            }
+          }
+        }
+        """
+    )
+)
+
+_VPC_VARIABLES_TF = dedent(
+    """
+    variable "subnet_ids" {
+      description = "List of subnet IDs for Lambda VPC configuration"
+      type        = list(string)
+    }
+
+    variable "function_name" {
+      description = "Lambda function name"
+      type        = string
+    }
+    """
+)
+
+_VARIABLES_TF_TEMPLATE = Template(
+    dedent(
+        """
+        variable "region" {
+          description = "AWS region"
+          type        = string
+        }
+
+        variable "role_arn" {
+          description = "IAM role ARN to assume"
+          type        = string
+          default     = null
+        }
+
+        $vpc_variables
+        """
+    )
+)
+
+# variables.tf for the matrix module (see create_matrix_terraform_config), which deploys
+# one Lambda per entry of var.variants, keyed by function name
+_MATRIX_VARIABLES_TF = dedent(
+    """
+    variable "region" {
+      description = "AWS region"
+      type        = string
+    }
+
+    variable "role_arn" {
+      description = "IAM role ARN to assume"
+      type        = string
+      default     = null
+    }
+
+    variable "variants" {
+      description = "Lambda variants to deploy, keyed by function name"
+      type = map(object({
+        python_version = string
+        architecture   = string
+      }))
+    }
+    """
+)
+
+_PROVIDER_TF = dedent(
+    """
+    provider "aws" {
+      region = var.region
+      dynamic "assume_role" {
+        for_each = var.role_arn != null ? [1] : []
+        content {
+          role_arn = var.role_arn
+        }
+      }
+      default_tags {
+        tags = {
+          "created_by" : "infrahouse/terraform-aws-lambda-monitored"
+          # Let a TTL-based sweeper clean up stacks that tests did not destroy
+          "TTL" : "120"
+          "Owner" : "pytest"
+        }
+      }
+    }
+    """
+)
+
+_VPC_SECURITY_GROUP_TF = dedent(
+    """
+    # Get VPC ID from subnet
+    data "aws_subnet" "selected" {
+      id = var.subnet_ids[0]
+    }
+
+    # Security group for Lambda
+    resource "aws_security_group" "lambda" {
+      name_prefix = "${var.function_name}-"
+      description = "Security group for ${var.function_name} Lambda function"
+      vpc_id      = data.aws_subnet.selected.vpc_id
+
+      egress {
+        from_port   = 0
+        to_port     = 0
+        protocol    = "-1"
+        cidr_blocks = ["0.0.0.0/0"]
+      }
+
+      tags = {
+        Name       = "${var.function_name}-sg"
+        created_by = "terraform-aws-lambda-monitored-test"
+      }
+    }
+    """
+)
+
+_MAIN_TF_TEMPLATE = Template(
+    dedent(
+        """
+        $sg_resource
+        module "lambda_monitored" {
+          source = "./.."  # Points to the root module
+
+          function_name     = "$function_name"
+          lambda_source_dir = "$lambda_source_dir"
+          python_version    = "$python_version"
+          architecture      = "$architecture"
+          alert_strategy    = "$alert_strategy"
+
+          alarm_emails = ["$alarm_email"]
+
+          # Threshold-specific settings
+          error_rate_threshold            = 5.0
+          error_rate_evaluation_periods   = 2
+          error_rate_datapoints_to_alarm  = 2
+          $memory_config
+          $vpc_config
+          tags = {
+            environment = "development"
+          }
+        }
+        """
+    )
+)
+
+_MATRIX_MAIN_TF_TEMPLATE = Template(
+    dedent(
+        """
+        module "lambda_monitored" {
+          source   = "./.."  # Points to the root module
+          for_each = var.variants
+
+          function_name     = each.key
+          lambda_source_dir = "$lambda_source_dir"
+          python_version    = each.value.python_version
+          architecture      = each.value.architecture
+          alert_strategy    = "$alert_strategy"
+
+          alarm_emails = ["$alarm_email"]
+
+          tags = {
+            environment = "development"
+          }
+        }
+        """
+    )
+)
+
+_OUTPUTS_TF = dedent(
+    """
+    output "lambda_function_arn" {
+      value = module.lambda_monitored.lambda_function_arn
+    }
+
+    output "lambda_function_name" {
+      value = module.lambda_monitored.lambda_function_name
+    }
+
+    output "lambda_role_arn" {
+      value = module.lambda_monitored.lambda_role_arn
+    }
+
+    output "cloudwatch_log_group_name" {
+      value = module.lambda_monitored.cloudwatch_log_group_name
+    }
+
+    output "sns_topic_arn" {
+      value = module.lambda_monitored.sns_topic_arn
+    }
+
+    output "error_alarm_arn" {
+      value = module.lambda_monitored.error_alarm_arn
+    }
+
+    output "s3_bucket_name" {
+      value = module.lambda_monitored.s3_bucket_name
+    }
+
+    output "requirements_file_used" {
+      value = module.lambda_monitored.requirements_file_used
+    }
+
+    output "vpc_config_subnet_ids" {
+      value = module.lambda_monitored.vpc_config_subnet_ids
+    }
+
+    output "vpc_config_security_group_ids" {
+      value = module.lambda_monitored.vpc_config_security_group_ids
+    }
+
+    output "memory_alarm_arn" {
+      value = module.lambda_monitored.memory_alarm_arn
+    }
+
+    output "lambda_insights_layer_arn" {
+      value = module.lambda_monitored.lambda_insights_layer_arn
+    }
+    """
+)
+
+
+_MATRIX_OUTPUTS_TF = dedent(
+    """
+    output "lambdas" {
+      value = {
+        for name, lambda in module.lambda_monitored : name => {
+          lambda_function_arn       = lambda.lambda_function_arn
+          lambda_function_name      = lambda.lambda_function_name
+          lambda_role_arn           = lambda.lambda_role_arn
+          cloudwatch_log_group_name = lambda.cloudwatch_log_group_name
+          sns_topic_arn             = lambda.sns_topic_arn
+          error_alarm_arn           = lambda.error_alarm_arn
+          s3_bucket_name            = lambda.s3_bucket_name
+          requirements_file_used    = lambda.requirements_file_used
+        }
+      }
+    }
+    """
+)
+
 
 # Pytest hooks
 # More details on
@@ -23,6 +299,105 @@ def pytest_runtest_logfinish(nodeid, location):
     LOG.info(f"TEST ENDED: {nodeid}")
 
 
+def pytest_addoption(parser):
+    """Register command line options of this test suite."""
+    parser.addoption(
+        "--outputs-from-state",
+        action="store_true",
+        default=False,
+        help=(
+            "Read Terraform outputs from the local terraform.tfstate instead of running "
+            "'terraform output'. Only valid with the default local backend."
+        ),
+    )
+
+
+# Characters dropped from architecture and Python version strings in function names
+_FNAME_TBL = str.maketrans({"_": "", ".": ""})
+
+
+def sanitize(value: str) -> str:
+    """
+    Make a parameter value usable in a test function name, e.g. ``python3.12`` -> ``python312``.
+
+    :param str value: Parameter value, e.g. an architecture or Python version
+    :return: The value without underscores and dots
+    :rtype: str
+    """
+    return value.translate(_FNAME_TBL)
+
+
+def variant_function_name(prefix: str, architecture: str, python_version: str) -> str:
+    """
+    Name of the function deployed for one architecture and Python version variant.
+
+    :param str prefix: Function name prefix, e.g. ``test-simple``
+    :param str architecture: Lambda architecture (x86_64 or arm64)
+    :param str python_version: Python runtime version
+    :return: Function name, e.g. ``test-simple-x8664-python312``
+    :rtype: str
+    """
+    return f"{prefix}-{sanitize(architecture)}-{sanitize(python_version)}"
+
+
+def _write_if_changed(path: Path, content: str) -> None:
+    """
+    Write a file only if its content differs from what is on disk.
+
+    Leaving identical files untouched preserves their mtimes, so Terraform
+    does not see spurious changes between runs that reuse the module directory.
+    Changed files are written to a temporary sibling and renamed into place,
+    so an interrupted run never leaves a truncated file behind.
+
+    :param Path path: File to write
+    :param str content: Desired file content
+    """
+    new = content.encode()
+    try:
+        if path.read_bytes() == new:
+            return
+    except FileNotFoundError:
+        pass
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(new)
+    os.replace(tmp_path, path)
+
+
+def _persistent_module_dir(name: str) -> Path:
+    """
+    Create a Terraform root module directory that survives between test runs.
+
+    The directory sits in the project root because the generated main.tf refers
+    to the module under test as ``./..``. The name must identify what is
+    deployed from it (a test or an xdist group), never the pytest-xdist worker:
+    which worker runs a test changes between runs, and a --keep-after stack is
+    only found again if the next run applies from the same directory.
+
+    :param str name: Directory name
+    :return: Path to the module directory
+    :rtype: Path
+    """
+    module_dir = _REPO_ROOT / name
+    module_dir.mkdir(exist_ok=True)
+    return module_dir
+
+
+def _remove_lock_file(module_dir: Path) -> None:
+    """
+    Clean up lock file to allow different provider versions between test runs.
+
+    :param Path module_dir: Terraform root module directory
+    """
+    lock_file = module_dir / ".terraform.lock.hcl"
+    try:
+        lock_file.unlink()
+        LOG.info(
+            "Removed existing .terraform.lock.hcl to allow provider version change"
+        )
+    except FileNotFoundError:
+        pass
+
+
 def create_terraform_config(
     module_dir: Path,
     lambda_source_dir: Path,
@@ -61,124 +436,34 @@ def create_terraform_config(
     """
     LOG.info("Creating Terraform root module in %s", module_dir)
 
-    # Clean up lock file to allow different provider versions between test runs
-    lock_file = module_dir / ".terraform.lock.hcl"
-    try:
-        lock_file.unlink()
-        LOG.info(
-            "Removed existing .terraform.lock.hcl to allow provider version change"
-        )
-    except FileNotFoundError:
-        pass
+    _remove_lock_file(module_dir)
 
     # Create terraform.tf
-    terraform_tf = dedent(
-        f"""
-        terraform {{
-          required_version = "~> 1.0"
-
-          required_providers {{
-            aws = {{
-              source  = "hashicorp/aws"
-              version = "{aws_provider_version}"
-            }}
-          }}
-        }}
-        """
+    terraform_tf = _TERRAFORM_TF_TEMPLATE.substitute(
+        aws_provider_version=aws_provider_version
     )
-    (module_dir / "terraform.tf").write_text(terraform_tf)
+    _write_if_changed(module_dir / "terraform.tf", terraform_tf)
 
     # Create variables.tf with optional VPC variables
     vpc_variables = ""
     if subnet_ids and security_group_ids is None:
-        vpc_variables = dedent(
-            """
-            variable "subnet_ids" {
-              description = "List of subnet IDs for Lambda VPC configuration"
-              type        = list(string)
-            }
+        vpc_variables = _VPC_VARIABLES_TF
 
-            variable "function_name" {
-              description = "Lambda function name"
-              type        = string
-            }
-            """
-        )
-
-    variables_tf = dedent(
-        f"""
-        variable "region" {{
-          description = "AWS region"
-          type        = string
-        }}
-
-        variable "role_arn" {{
-          description = "IAM role ARN to assume"
-          type        = string
-          default     = null
-        }}
-
-        {vpc_variables}
-        """
-    )
-    (module_dir / "variables.tf").write_text(variables_tf)
+    variables_tf = _VARIABLES_TF_TEMPLATE.substitute(vpc_variables=vpc_variables)
+    _write_if_changed(module_dir / "variables.tf", variables_tf)
 
     # Create provider.tf
-    provider_tf = dedent(
-        """
-        provider "aws" {
-          region = var.region
-          dynamic "assume_role" {
-            for_each = var.role_arn != null ? [1] : []
-            content {
-              role_arn = var.role_arn
-            }
-          }
-          default_tags {
-            tags = {
-              "created_by" : "infrahouse/terraform-aws-lambda-monitored"
-            }
-          }
-        }
-        """
-    )
-    (module_dir / "provider.tf").write_text(provider_tf)
+    _write_if_changed(module_dir / "provider.tf", _PROVIDER_TF)
 
     # Create main.tf with optional VPC configuration
-    import json
+    subnet_ids_json = json.dumps(subnet_ids) if subnet_ids else None
 
     # Create security group resource if VPC is configured
     sg_resource = ""
     vpc_config = ""
     if subnet_ids and security_group_ids is None:
         # Create security group in Terraform when VPC is configured
-        sg_resource = dedent(
-            """
-            # Get VPC ID from subnet
-            data "aws_subnet" "selected" {
-              id = var.subnet_ids[0]
-            }
-
-            # Security group for Lambda
-            resource "aws_security_group" "lambda" {
-              name_prefix = "${var.function_name}-"
-              description = "Security group for ${var.function_name} Lambda function"
-              vpc_id      = data.aws_subnet.selected.vpc_id
-
-              egress {
-                from_port   = 0
-                to_port     = 0
-                protocol    = "-1"
-                cidr_blocks = ["0.0.0.0/0"]
-              }
-
-              tags = {
-                Name       = "${var.function_name}-sg"
-                created_by = "terraform-aws-lambda-monitored-test"
-              }
-            }
-            """
-        )
+        sg_resource = _VPC_SECURITY_GROUP_TF
         vpc_config = """
           # VPC Configuration
           lambda_subnet_ids         = var.subnet_ids
@@ -187,7 +472,7 @@ def create_terraform_config(
     elif subnet_ids and security_group_ids:
         vpc_config = f"""
           # VPC Configuration
-          lambda_subnet_ids         = {json.dumps(subnet_ids)}
+          lambda_subnet_ids         = {subnet_ids_json}
           lambda_security_group_ids = {json.dumps(security_group_ids)}
         """
 
@@ -200,100 +485,299 @@ def create_terraform_config(
             f"memory_utilization_threshold_percent = {memory_utilization_threshold_percent}"
         )
 
-    main_tf = dedent(
-        f'''
-        {sg_resource}
-        module "lambda_monitored" {{
-          source = "./.."  # Points to the root module
+    main_tf = _MAIN_TF_TEMPLATE.substitute(
+        sg_resource=sg_resource,
+        function_name=function_name,
+        lambda_source_dir=lambda_source_dir_normalized,
+        python_version=python_version,
+        architecture=architecture,
+        alert_strategy=alert_strategy,
+        alarm_email=alarm_email,
+        memory_config=memory_config,
+        vpc_config=vpc_config,
+    )
+    _write_if_changed(module_dir / "main.tf", main_tf)
 
-          function_name     = "{function_name}"
-          lambda_source_dir = "{lambda_source_dir_normalized}"
-          python_version    = "{python_version}"
-          architecture      = "{architecture}"
-          alert_strategy    = "{alert_strategy}"
+    # Create outputs.tf
+    _write_if_changed(module_dir / "outputs.tf", _OUTPUTS_TF)
 
-          alarm_emails = ["{alarm_email}"]
+    # Create terraform.tfvars
+    tfvars_content = f'region = "{aws_region}"\n'
+    if role_arn:
+        tfvars_content += f'role_arn = "{role_arn}"\n'
+    if subnet_ids and security_group_ids is None:
+        tfvars_content += f"subnet_ids = {subnet_ids_json}\n"
+        tfvars_content += f'function_name = "{function_name}"\n'
+    _write_if_changed(module_dir / "terraform.tfvars", tfvars_content)
 
-          # Threshold-specific settings
-          error_rate_threshold            = 5.0
-          error_rate_evaluation_periods   = 2
-          error_rate_datapoints_to_alarm  = 2
-          {memory_config}
-          {vpc_config}
-          tags = {{
-            environment = "development"
-          }}
-        }}
-        '''
+
+def create_matrix_terraform_config(
+    module_dir: Path,
+    lambda_source_dir: Path,
+    alarm_email: str,
+    aws_provider_version: str,
+    alert_strategy: str = "immediate",
+):
+    """
+    Create a Terraform configuration that deploys several Lambda variants at once.
+
+    The module under test is instantiated with ``for_each`` over ``var.variants``,
+    so all variants are created by a single apply and Terraform builds them in
+    parallel. The variants themselves are passed in a tfvars file
+    (see write_matrix_tfvars()).
+
+    :param Path module_dir: Directory to create Terraform files in
+    :param Path lambda_source_dir: Path to Lambda source code
+    :param str alarm_email: Email address for alarm notifications
+    :param str aws_provider_version: AWS provider version constraint
+    :param str alert_strategy: Alert strategy (immediate or threshold)
+    """
+    LOG.info("Creating matrix Terraform root module in %s", module_dir)
+    _remove_lock_file(module_dir)
+
+    _write_if_changed(
+        module_dir / "terraform.tf",
+        _TERRAFORM_TF_TEMPLATE.substitute(aws_provider_version=aws_provider_version),
+    )
+    _write_if_changed(module_dir / "variables.tf", _MATRIX_VARIABLES_TF)
+    _write_if_changed(module_dir / "provider.tf", _PROVIDER_TF)
+    _write_if_changed(
+        module_dir / "main.tf",
+        _MATRIX_MAIN_TF_TEMPLATE.substitute(
+            lambda_source_dir=str(lambda_source_dir).replace("\\", "/"),
+            alert_strategy=alert_strategy,
+            alarm_email=alarm_email,
+        ),
     )
-    (module_dir / "main.tf").write_text(main_tf)
+    _write_if_changed(module_dir / "outputs.tf", _MATRIX_OUTPUTS_TF)
 
-    # Create outputs.tf
-    outputs_tf = dedent(
-        """
-        output "lambda_function_arn" {
-          value = module.lambda_monitored.lambda_function_arn
-        }
 
-        output "lambda_function_name" {
-          value = module.lambda_monitored.lambda_function_name
-        }
+def write_matrix_tfvars(
+    module_dir: Path,
+    variants: dict,
+    aws_region: str = "us-west-2",
+    role_arn: str = None,
+) -> str:
+    """
+    Write the variables for create_matrix_terraform_config().
 
-        output "lambda_role_arn" {
-          value = module.lambda_monitored.lambda_role_arn
-        }
+    :param Path module_dir: Directory of the matrix Terraform module
+    :param dict variants: Function name to ``{"python_version": ..., "architecture": ...}``
+    :param str aws_region: AWS region for deployment
+    :param str role_arn: IAM role ARN to assume for testing (optional)
+    :return: Name of the tfvars file, for terraform_apply(var_file=...)
+    :rtype: str
+    """
+    tfvars = {"region": aws_region, "variants": variants}
+    if role_arn:
+        tfvars["role_arn"] = role_arn
 
-        output "cloudwatch_log_group_name" {
-          value = module.lambda_monitored.cloudwatch_log_group_name
-        }
+    var_file = "terraform.tfvars.json"
+    _write_if_changed(module_dir / var_file, json.dumps(tfvars, indent=2) + "\n")
+    return var_file
 
-        output "sns_topic_arn" {
-          value = module.lambda_monitored.sns_topic_arn
-        }
 
-        output "error_alarm_arn" {
-          value = module.lambda_monitored.error_alarm_arn
-        }
+def read_outputs(module_dir: Path) -> dict:
+    """
+    Read the outputs of an applied root module from its local state file.
 
-        output "s3_bucket_name" {
-          value = module.lambda_monitored.s3_bucket_name
-        }
+    The result has the same shape as ``terraform output -json``
+    (``{"name": {"value": ..., "type": ...}}``).
 
-        output "requirements_file_used" {
-          value = module.lambda_monitored.requirements_file_used
-        }
+    :param Path module_dir: Terraform root module directory using the local backend
+    :return: Terraform outputs
+    :rtype: dict
+    """
+    with open(Path(module_dir) / "terraform.tfstate", encoding="utf-8") as state_file:
+        return json.load(state_file)["outputs"]
 
-        output "vpc_config_subnet_ids" {
-          value = module.lambda_monitored.vpc_config_subnet_ids
-        }
 
-        output "vpc_config_security_group_ids" {
-          value = module.lambda_monitored.vpc_config_security_group_ids
-        }
+@contextmanager
+def apply_module(
+    module_dir: Path,
+    destroy_after: bool,
+    outputs_from_state: bool = False,
+    var_file: str = "terraform.tfvars",
+):
+    """
+    Apply a root module with terraform_apply() and yield its outputs.
 
-        output "memory_alarm_arn" {
-          value = module.lambda_monitored.memory_alarm_arn
-        }
+    With outputs_from_state the outputs are read from terraform.tfstate,
+    which saves the ``terraform output`` subprocess after every apply.
 
-        output "lambda_insights_layer_arn" {
-          value = module.lambda_monitored.lambda_insights_layer_arn
-        }
-        """
+    :param Path module_dir: Terraform root module directory
+    :param bool destroy_after: Whether to destroy the resources afterwards
+    :param bool outputs_from_state: Read outputs from the local state file
+    :param str var_file: Variables file, relative to module_dir
+    :return: Terraform outputs, as returned by ``terraform output -json``
+    :rtype: dict
+    """
+    with terraform_apply(
+        str(module_dir),
+        destroy_after=destroy_after,
+        json_output=not outputs_from_state,
+        var_file=var_file,
+    ) as tf_output:
+        yield read_outputs(module_dir) if outputs_from_state else tf_output
+
+
+def decode_payload(response) -> dict:
+    """
+    Decode the JSON payload of a Lambda ``invoke()`` response.
+
+    :param dict response: Response of the boto3 Lambda client ``invoke()`` call
+    :return: Decoded payload returned by the function
+    :rtype: dict
+    """
+    return orjson.loads(response["Payload"].read())
+
+
+def invoke(client, function_name: str, payload: dict = None) -> tuple:
+    """
+    Synchronously invoke a Lambda function.
+
+    The response payload is only decoded when the function succeeded, so
+    callers that expect an error do not parse the error document.
+
+    :param client: Boto3 Lambda client
+    :param str function_name: Name of the function to invoke
+    :param dict payload: Event to send (an empty event by default)
+    :return: HTTP status code, whether the function raised an error, and the
+        decoded payload (None if the function raised an error)
+    :rtype: tuple
+    """
+    response = client.invoke(
+        FunctionName=function_name,
+        InvocationType="RequestResponse",
+        Payload=orjson.dumps(payload or {}),
     )
-    (module_dir / "outputs.tf").write_text(outputs_tf)
+    err = "FunctionError" in response
+    body = None if err else decode_payload(response)
+    return response["StatusCode"], err, body
 
-    # Create terraform.tfvars
-    tfvars_content = f'region = "{aws_region}"\n'
-    if role_arn:
-        tfvars_content += f'role_arn = "{role_arn}"\n'
-    if subnet_ids and security_group_ids is None:
-        tfvars_content += f"subnet_ids = {json.dumps(subnet_ids)}\n"
-        tfvars_content += f'function_name = "{function_name}"\n'
-    (module_dir / "terraform.tfvars").write_text(tfvars_content)
 
+def with_retry(fn, attempts: int = 5, base: float = 0.5, until=None):
+    """
+    Call an AWS API with bounded retries for eventual consistency.
+
+    Right after an apply, newly created resources may not be visible yet:
+    the call either fails with a ClientError or returns a stale result.
+    Both are retried with exponential backoff (base, 2 * base, ...).
+
+    :param callable fn: Function to call, without arguments
+    :param int attempts: Maximum number of calls
+    :param float base: Delay before the first retry, in seconds
+    :param callable until: Predicate on the result; retry while it returns False (optional)
+    :return: Result of the last call
+    :raises ClientError: If the last attempt still fails
+    """
+    for attempt in range(attempts):
+        last_attempt = attempt == attempts - 1
+        try:
+            result = fn()
+        except ClientError as err:
+            if last_attempt:
+                raise
+            LOG.info("Retrying after %s", err)
+        else:
+            if until is None or until(result) or last_attempt:
+                return result
+            LOG.info("Retrying until the result is consistent")
+        time.sleep(base * 2**attempt)
+
+
+@pytest.fixture(scope="session")
+def outputs_from_state(request):
+    """
+    Whether --outputs-from-state was given.
+
+    :param request: Pytest request object
+    :return: True to read Terraform outputs from the local state file
+    :rtype: bool
+    """
+    return request.config.getoption("--outputs-from-state")
+
+
+@pytest.fixture(scope="session")
+def destroy_after(keep_after):
+    """
+    Whether to destroy Terraform resources after each apply.
+
+    Destroy is skipped with --keep-after, or when ``TEST_SKIP_DESTROY=true`` is
+    set. The latter is meant for CI pipelines that run a sweeper which deletes
+    resources tagged ``Owner=pytest`` once their ``TTL`` (in minutes) has
+    expired; function names are fixed, so a later run fails on leftovers that
+    have not been swept yet.
 
-# Parameterization for different test configurations
-@pytest.fixture(params=["~> 6.0"], ids=["provider-6.x"])
+    :param bool keep_after: Whether --keep-after was given
+    :return: True to run terraform destroy after apply
+    :rtype: bool
+    """
+    if keep_after:
+        return False
+    return os.environ.get("TEST_SKIP_DESTROY") != "true"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def terraform_plugin_cache(worker_id):
+    """
+    Share downloaded Terraform providers between test runs.
+
+    Points ``TF_PLUGIN_CACHE_DIR`` at a persistent cache before any
+    ``terraform init`` runs: under an already set ``TF_PLUGIN_CACHE_DIR``, or
+    under ``~/.terraform.d/plugin-cache`` otherwise. The cache is not safe for
+    concurrent writers, so each pytest-xdist worker gets its own subdirectory
+    in either case.
+    create_terraform_config() removes the lock file on every call, so the cache
+    is also allowed to satisfy providers that are missing from the lock file.
+
+    :param str worker_id: pytest-xdist worker ID ("master" when not distributed)
+    :return: Path to the plugin cache directory
+    :rtype: Path
+    """
+    cache_root = os.environ.get("TF_PLUGIN_CACHE_DIR")
+    cache_root = (
+        Path(cache_root)
+        if cache_root
+        else Path.home() / ".terraform.d" / "plugin-cache"
+    )
+    cache_dir = cache_root / worker_id
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    LOG.info("Using Terraform plugin cache %s", cache_dir)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("TF_PLUGIN_CACHE_DIR", str(cache_dir))
+        mp.setenv("TF_PLUGIN_CACHE_MAY_BREAK_DEPENDENCY_LOCK_FILE", "true")
+        yield cache_dir
+
+
+@pytest.fixture(scope="session", autouse=True)
+def terraform_parallelism():
+    """
+    Let Terraform create and destroy more resources concurrently.
+
+    terraform_apply() has no way to pass extra arguments, so ``-parallelism``
+    (default 10) is set through ``TF_CLI_ARGS_apply`` and
+    ``TF_CLI_ARGS_destroy``. Values already present in the environment win.
+
+    :return: Number of concurrent Terraform operations
+    :rtype: int
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for var in ("TF_CLI_ARGS_apply", "TF_CLI_ARGS_destroy"):
+            if var not in os.environ:
+                mp.setenv(var, f"-parallelism={TERRAFORM_PARALLELISM}")
+        yield TERRAFORM_PARALLELISM
+
+
+# Parameterization for different test configurations.
+# Session scope lets session-scoped stacks (e.g. deployed_simple_lambdas) depend on
+# them; pytest then groups tests by parameter so each stack is applied once.
+ARCHITECTURES = ["x86_64", "arm64"]
+PYTHON_VERSIONS = ["python3.11", "python3.12", "python3.13"]
+
+
+@pytest.fixture(scope="session", params=["~> 6.0"], ids=["provider-6.x"])
 def aws_provider_version(request):
     """
     AWS provider version to test.
@@ -305,7 +789,7 @@ def aws_provider_version(request):
     return request.param
 
 
-@pytest.fixture(params=["x86_64", "arm64"], ids=["x86", "arm64"])
+@pytest.fixture(scope="session", params=ARCHITECTURES, ids=["x86", "arm64"])
 def architecture(request):
     """
     Lambda function architecture to test.
@@ -318,7 +802,8 @@ def architecture(request):
 
 
 @pytest.fixture(
-    params=["python3.11", "python3.12", "python3.13"],
+    scope="session",
+    params=PYTHON_VERSIONS,
     ids=["py3.11", "py3.12", "py3.13"],
 )
 def python_version(request):
@@ -345,24 +830,206 @@ def alert_strategy(request):
 
 
 @pytest.fixture
-def test_module_dir():
+def test_module_dir(request):
     """
     Create Terraform module directory for testing.
 
-    Uses a consistent directory location to preserve Terraform state across
-    test runs. This allows --keep-after to work properly by maintaining state
-    between debugging sessions.
+    Uses a consistent directory location per test (``test_data-<test name>``)
+    to preserve Terraform state across test runs. This allows --keep-after to
+    work properly by maintaining state between debugging sessions, and tests
+    running in parallel on different pytest-xdist workers never share state.
 
+    :param request: Pytest request object
     :return: Path to test module directory
     :rtype: Path
     """
-    # Use consistent directory in project root for state persistence
-    module_dir = Path(__file__).parent.parent / "test_data"
-    module_dir.mkdir(exist_ok=True)
-    return module_dir
+    return _persistent_module_dir(f"test_data-{request.node.originalname}")
+
+
+@pytest.fixture(scope="session")
+def simple_lambda_module_dir():
+    """
+    Create the Terraform module directory for the shared simple Lambda stack.
+
+    Kept apart from test_module_dir so that tests applying their own
+    configuration do not overwrite the shared stack while it is deployed.
+    Its users share the ``simple_lambda`` xdist group, so one worker owns it.
+
+    :return: Path to the shared stack module directory
+    :rtype: Path
+    """
+    return _persistent_module_dir("test_data-simple")
+
+
+@pytest.fixture(scope="session")
+def deps_lambda_module_dir():
+    """
+    Create the Terraform module directory for the shared Lambda-with-dependencies stack.
+
+    Its users share the ``deps_lambda`` xdist group, so one worker owns it.
+
+    :return: Path to the shared stack module directory
+    :rtype: Path
+    """
+    return _persistent_module_dir("test_data-deps")
+
+
+@contextmanager
+def _deployed_matrix(
+    module_dir: Path,
+    lambda_source_dir: Path,
+    name_prefix: str,
+    aws_provider_version: str,
+    aws_region: str,
+    destroy_after: bool,
+    role_arn: str,
+    outputs_from_state: bool,
+):
+    """
+    Deploy a Lambda fixture for every architecture and Python version in one apply.
+
+    Used by session-scoped fixtures: the stack stays applied for as long as the
+    fixture is alive and is destroyed once, when pytest tears the fixture down.
+
+    :param Path module_dir: Directory for the matrix Terraform module
+    :param Path lambda_source_dir: Path to Lambda source code
+    :param str name_prefix: Function name prefix; variants are named by variant_function_name()
+    :param str aws_provider_version: AWS provider version constraint
+    :param str aws_region: AWS region for deployment
+    :param bool destroy_after: Whether to destroy resources afterwards
+    :param str role_arn: IAM role ARN to assume for testing (optional)
+    :param bool outputs_from_state: Read Terraform outputs from the local state file
+    :return: Outputs of each deployed variant, keyed by function name
+    :rtype: dict
+    """
+    create_matrix_terraform_config(
+        module_dir,
+        lambda_source_dir,
+        "devnull@infrahouse.com",
+        aws_provider_version,
+    )
+    variants = {
+        variant_function_name(name_prefix, architecture, python_version): {
+            "python_version": python_version,
+            "architecture": architecture,
+        }
+        for architecture in ARCHITECTURES
+        for python_version in PYTHON_VERSIONS
+    }
+    var_file = write_matrix_tfvars(
+        module_dir,
+        variants,
+        aws_region=aws_region,
+        role_arn=role_arn,
+    )
+
+    with apply_module(
+        module_dir,
+        destroy_after,
+        outputs_from_state,
+        var_file=var_file,
+    ) as tf_output:
+        yield tf_output["lambdas"]["value"]
+
+
+@pytest.fixture(scope="session")
+def deployed_simple_lambdas(
+    simple_lambda_module_dir,
+    fixtures_dir,
+    aws_provider_version,
+    aws_region,
+    destroy_after,
+    test_role_arn,
+    outputs_from_state,
+):
+    """
+    Deploy the simple Lambda fixture for every architecture and Python version.
+
+    All variants are created by one apply of the matrix module and shared by
+    every test that only inspects or invokes the simple Lambda. The stack is
+    destroyed when pytest moves on to another provider version (or the session
+    ends); the provider version is global to a root module, so it is the only
+    axis that still needs an apply of its own.
+
+    :param Path simple_lambda_module_dir: Module directory for the shared stack
+    :param Path fixtures_dir: Path to Lambda fixtures
+    :param str aws_provider_version: AWS provider version to test
+    :param str aws_region: AWS region for deployment
+    :param bool destroy_after: Whether to destroy resources after the session
+    :param str test_role_arn: IAM role ARN for testing
+    :param bool outputs_from_state: Read Terraform outputs from the local state file
+    :return: Outputs of each deployed variant, keyed by function name
+    :rtype: dict
+    """
+    with _deployed_matrix(
+        simple_lambda_module_dir,
+        fixtures_dir / "simple_lambda",
+        "test-simple",
+        aws_provider_version,
+        aws_region,
+        destroy_after,
+        test_role_arn,
+        outputs_from_state,
+    ) as lambdas:
+        yield lambdas
 
 
 @pytest.fixture
+def deployed_simple_lambda(deployed_simple_lambdas, architecture, python_version):
+    """
+    Outputs of the simple Lambda variant for the current architecture and Python version.
+
+    :param dict deployed_simple_lambdas: Outputs of all deployed simple Lambda variants
+    :param str architecture: Lambda architecture to test
+    :param str python_version: Python version to test
+    :return: Module outputs of the variant, e.g. ``{"lambda_function_name": ...}``
+    :rtype: dict
+    """
+    return deployed_simple_lambdas[
+        variant_function_name("test-simple", architecture, python_version)
+    ]
+
+
+@pytest.fixture(scope="session")
+def deployed_deps_lambdas(
+    deps_lambda_module_dir,
+    fixtures_dir,
+    aws_provider_version,
+    aws_region,
+    destroy_after,
+    test_role_arn,
+    outputs_from_state,
+):
+    """
+    Deploy the Lambda-with-dependencies fixture for every architecture and Python version.
+
+    Shared by the packaging and execution tests, so each variant is built and
+    deployed once per session instead of once per test.
+
+    :param Path deps_lambda_module_dir: Module directory for the shared stack
+    :param Path fixtures_dir: Path to Lambda fixtures
+    :param str aws_provider_version: AWS provider version to test
+    :param str aws_region: AWS region for deployment
+    :param bool destroy_after: Whether to destroy resources after the session
+    :param str test_role_arn: IAM role ARN for testing
+    :param bool outputs_from_state: Read Terraform outputs from the local state file
+    :return: Outputs of each deployed variant, keyed by function name
+    :rtype: dict
+    """
+    with _deployed_matrix(
+        deps_lambda_module_dir,
+        fixtures_dir / "lambda_with_deps",
+        "test-deps",
+        aws_provider_version,
+        aws_region,
+        destroy_after,
+        test_role_arn,
+        outputs_from_state,
+    ) as lambdas:
+        yield lambdas
+
+
+@pytest.fixture(scope="session")
 def fixtures_dir():
     """
     Get path to test fixtures directory.
@@ -370,40 +1037,48 @@ def fixtures_dir():
     :return: Path to fixtures directory containing Lambda code
     :rtype: Path
     """
-    return Path(__file__).parent / "fixtures"
+    return _TESTS_DIR / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def lambda_client(boto3_session, aws_region):
     """
     Create boto3 Lambda client from pytest-infrahouse boto3_session.
 
+    One thread-safe client is shared by the whole session.
+
     :param boto3_session: Boto3 session from pytest-infrahouse
     :param str aws_region: AWS region for the client
     :return: Boto3 Lambda client
     """
-    return boto3_session.client("lambda", region_name=aws_region)
+    return boto3_session.client("lambda", region_name=aws_region, config=_BOTO_CONFIG)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cloudwatch_client(boto3_session, aws_region):
     """
     Create boto3 CloudWatch client from pytest-infrahouse boto3_session.
 
+    One thread-safe client is shared by the whole session.
+
     :param boto3_session: Boto3 session from pytest-infrahouse
     :param str aws_region: AWS region for the client
     :return: Boto3 CloudWatch client
     """
-    return boto3_session.client("cloudwatch", region_name=aws_region)
+    return boto3_session.client(
+        "cloudwatch", region_name=aws_region, config=_BOTO_CONFIG
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sns_client(boto3_session, aws_region):
     """
     Create boto3 SNS client from pytest-infrahouse boto3_session.
 
+    One thread-safe client is shared by the whole session.
+
     :param boto3_session: Boto3 session from pytest-infrahouse
     :param str aws_region: AWS region for the client
     :return: Boto3 SNS client
     """
-    return boto3_session.client("sns", region_name=aws_region)
+    return boto3_session.client("sns", region_name=aws_region, config=_BOTO_CONFIG)
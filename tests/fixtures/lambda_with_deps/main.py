@@ -6,7 +6,116 @@ to make HTTP calls. Used for testing dependency packaging with platform-specific
 """
 
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+
 import requests
+from requests.adapters import HTTPAdapter
+
+# HTTP testing endpoints to try (for resilience)
+ENDPOINTS = (
+    "https://httpbin.org/get",
+    "https://httpbun.com/get",
+)
+REQUEST_TIMEOUT = 5
+
+# Circuit breaker: endpoints whose failure count reaches the threshold are skipped
+# while a healthier one is available; counts reset every N invocations
+FAILURE_THRESHOLD = 3
+FAILURE_RESET_INVOCATIONS = 20
+
+_failure_counts = {endpoint: 0 for endpoint in ENDPOINTS}
+_invocations = 0
+
+# Shared session so warm invocations reuse pooled keep-alive connections
+_http = requests.Session()
+_http.headers.update({"User-Agent": "lambda-test/1.0"})
+_http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+# One worker per endpoint so all of them can be requested at once
+_executor = ThreadPoolExecutor(max_workers=len(ENDPOINTS))
+
+
+def _fetch(endpoint):
+    """
+    Fetch an endpoint and fail on a non-2xx response.
+
+    :param str endpoint: URL to request
+    :return: Successful HTTP response
+    :rtype: requests.Response
+    :raises requests.RequestException: If the request fails or returns an error status
+    """
+    response = _http.get(endpoint, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response
+
+
+def _endpoints_to_try():
+    """
+    Split the endpoints into the ones to request first and the last resort.
+
+    Failure counts are kept for the lifetime of a warm container, so an endpoint
+    that keeps failing is only requested when every healthy endpoint failed,
+    until the periodic reset.
+
+    :return: Healthy endpoints ordered by ascending failure count, and tripped endpoints
+    :rtype: tuple
+    """
+    global _invocations
+    _invocations += 1
+    if _invocations % FAILURE_RESET_INVOCATIONS == 0:
+        _failure_counts.update(dict.fromkeys(_failure_counts, 0))
+
+    ordered = sorted(ENDPOINTS, key=_failure_counts.get)
+    healthy = [ep for ep in ordered if _failure_counts[ep] < FAILURE_THRESHOLD]
+    tripped = [ep for ep in ordered if _failure_counts[ep] >= FAILURE_THRESHOLD]
+    return healthy, tripped
+
+
+def _first_success(endpoints, errors, deadline):
+    """
+    Request endpoints in parallel and return the first successful response.
+
+    Failures are recorded in ``errors`` and in the failure counts.
+
+    :param list endpoints: Endpoints to request
+    :param list errors: List to append ``{"endpoint": ..., "error": ...}`` records to
+    :param float deadline: ``time.monotonic()`` value after which to stop waiting
+    :return: Endpoint and its response, or None if every endpoint failed
+    :rtype: tuple or None
+    """
+    observed = set()
+    futures = {_executor.submit(_fetch, endpoint): endpoint for endpoint in endpoints}
+
+    try:
+        for future in as_completed(futures, timeout=deadline - time.monotonic()):
+            endpoint = futures[future]
+            observed.add(future)
+            try:
+                response = future.result()
+            except requests.RequestException as e:
+                # Record error and wait for the remaining endpoints
+                errors.append({"endpoint": endpoint, "error": str(e)})
+                _failure_counts[endpoint] += 1
+                continue
+
+            _failure_counts[endpoint] = max(0, _failure_counts[endpoint] - 1)
+
+            # Success! Count failures that already finished, drop requests
+            # that have not started yet and return
+            for other, other_endpoint in futures.items():
+                if other in observed or other.cancel():
+                    continue
+                if other.done() and other.exception() is not None:
+                    _failure_counts[other_endpoint] += 1
+            return endpoint, response
+    except TimeoutError:
+        for future, endpoint in futures.items():
+            if not future.done():
+                errors.append({"endpoint": endpoint, "error": "Timed out"})
+                _failure_counts[endpoint] += 1
+
+    return None
 
 
 def lambda_handler(event, context):
@@ -14,8 +123,10 @@ def lambda_handler(event, context):
     Handle Lambda invocation with HTTP request to external API.
 
     Makes a test HTTP request to verify that the requests library is properly
-    packaged with platform-specific wheels. Tries multiple HTTP testing endpoints
-    for resilience against service outages.
+    packaged with platform-specific wheels. The healthy HTTP testing endpoints
+    are requested in parallel and the first successful response wins, so a slow
+    endpoint does not delay the result. Endpoints that keep failing are only
+    tried when all healthy ones failed.
 
     :param dict event: Lambda event object containing request data
     :param LambdaContext context: Lambda context object with runtime information
@@ -27,36 +138,36 @@ def lambda_handler(event, context):
     >>> lambda_handler({}, None)  # doctest: +SKIP
     {'statusCode': 200, 'body': '{"success": true, "requests_version": "2.31.0"}'}
     """
-    # List of HTTP testing endpoints to try (for resilience)
-    endpoints = [
-        "https://httpbin.org/get",
-        "https://httpbun.com/get",
-    ]
-
     errors = []
-
-    # Try each endpoint until one succeeds
-    for endpoint in endpoints:
-        try:
-            response = requests.get(endpoint, timeout=5)
-            response.raise_for_status()
-
-            # Success! Return immediately
-            return {
-                "statusCode": 200,
-                "body": json.dumps(
-                    {
-                        "success": True,
-                        "requests_version": requests.__version__,
-                        "endpoint_used": endpoint,
-                        "status_code": response.status_code,
-                    }
-                ),
-            }
-        except requests.RequestException as e:
-            # Record error and try next endpoint
-            errors.append({"endpoint": endpoint, "error": str(e)})
+    # One deadline for all tiers, so hanging healthy endpoints do not add a second
+    # wait for the tripped ones. Connect and read timeouts apply separately, so
+    # allow for both.
+    deadline = time.monotonic() + 2 * REQUEST_TIMEOUT
+    for endpoints in _endpoints_to_try():
+        if not endpoints:
+            continue
+        if time.monotonic() >= deadline:
+            errors.extend(
+                {"endpoint": endpoint, "error": "Not tried before the deadline"}
+                for endpoint in endpoints
+            )
             continue
+        result = _first_success(endpoints, errors, deadline)
+        if result is None:
+            continue
+
+        endpoint, response = result
+        return {
+            "statusCode": 200,
+            "body": json.dumps(
+                {
+                    "success": True,
+                    "requests_version": requests.__version__,
+                    "endpoint_used": endpoint,
+                    "status_code": response.status_code,
+                }
+            ),
+        }
 
     # All endpoints failed
     return {
@@ -7,6 +7,12 @@ on demand, used for testing CloudWatch alarm functionality.
 
 import json
 
+# Constant part of the success body, serialized once at import
+_SUCCESS_BODY_PREFIX = (
+    json.dumps({"success": True, "message": "Function executed successfully"})[:-1]
+    + ', "event": '
+)
+
 
 class IntentionalTestError(Exception):
     """
@@ -16,8 +22,6 @@ class IntentionalTestError(Exception):
     receives a request to simulate an error condition.
     """
 
-    pass
-
 
 def lambda_handler(event, context):
     """
@@ -37,8 +41,9 @@ def lambda_handler(event, context):
 
     Success case:
 
-    >>> lambda_handler({'message': 'hello'}, None)
-    {'statusCode': 200, 'body': '{"success": true, "message": "Function executed successfully"}'}
+    >>> lambda_handler({'message': 'hello'}, None)  # doctest: +NORMALIZE_WHITESPACE
+    {'statusCode': 200, 'body': '{"success": true, "message": "Function executed successfully",
+    "event": {"message": "hello"}}'}
 
     Error case:
 
@@ -54,11 +59,5 @@ def lambda_handler(event, context):
     # Normal successful execution
     return {
         "statusCode": 200,
-        "body": json.dumps(
-            {
-                "success": True,
-                "message": "Function executed successfully",
-                "event": event,
-            }
-        ),
+        "body": _SUCCESS_BODY_PREFIX + json.dumps(event) + "}",
     }
@@ -8,29 +8,102 @@ This module tests the Lambda monitoring module across different configurations:
 - Alert strategies (immediate and threshold)
 """
 
-import json
+import os
+import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+import orjson
+import pytest
 from infrahouse_core.timeout import timeout
-from pytest_infrahouse import terraform_apply
 
-from tests.conftest import LOG, create_terraform_config
+from tests.conftest import (
+    LOG,
+    apply_module,
+    create_terraform_config,
+    invoke,
+    variant_function_name,
+    with_retry,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _terraform_version():
+    """
+    Return the version of the ``terraform`` binary on ``PATH``.
+
+    :return: Version string (e.g. ``"1.9.5"``), or None if terraform is not installed
+    :rtype: str
+    """
+    try:
+        result = subprocess.run(
+            ["terraform", "version", "-json"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        return None
+    return orjson.loads(result.stdout)["terraform_version"]
+
+
+class TestTerraformUnit:
+    """Plan-only Terraform tests that need no AWS resources."""
+
+    @pytest.mark.terraform_test
+    def test_terraform_native(self, tmp_path):
+        """
+        Run the module's native ``terraform test`` suite.
+
+        The ``*.tftest.hcl`` files in ``tests/unit`` assert on planned values
+        against a mocked AWS provider, so configuration-only checks run in
+        seconds without an apply. ``mock_provider`` needs Terraform 1.7+, so
+        the test is skipped on older versions. ``terraform init`` keeps its
+        working data in ``tmp_path`` and the lock file it writes to the repo
+        root is removed afterwards.
+
+        :param Path tmp_path: Per-test temporary directory (pytest fixture)
+        """
+        version = _terraform_version()
+        if version is None:
+            pytest.skip("terraform is not installed")
+        if tuple(int(part) for part in version.split("-")[0].split(".")[:2]) < (1, 7):
+            pytest.skip(
+                f"terraform test with mock_provider needs Terraform 1.7+, found {version}"
+            )
+
+        lock_file = REPO_ROOT / ".terraform.lock.hcl"
+        keep_lock_file = lock_file.exists()
+        env = dict(os.environ, TF_DATA_DIR=str(tmp_path / ".terraform"))
+        try:
+            for cmd in (
+                ["terraform", "init", "-no-color", "-test-directory=tests/unit"],
+                ["terraform", "test", "-no-color", "-test-directory=tests/unit"],
+            ):
+                result = subprocess.run(
+                    cmd, cwd=REPO_ROOT, env=env, capture_output=True, text=True
+                )
+                LOG.info("%s output:\n%s", " ".join(cmd[:2]), result.stdout)
+                assert result.returncode == 0, result.stderr or result.stdout
+        finally:
+            if not keep_lock_file:
+                lock_file.unlink(missing_ok=True)
 
 
+# Tests sharing deployed_simple_lambda stay on one xdist worker, so a stack
+# (and its function name) is never deployed by two workers at once.
+@pytest.mark.xdist_group(name="simple_lambda")
 class TestSimpleLambda:
     """Test suite for simple Lambda function without dependencies."""
 
     def test_lambda_deployment(
         self,
-        test_module_dir,
-        fixtures_dir,
-        aws_provider_version,
+        deployed_simple_lambda,
         architecture,
         python_version,
-        keep_after,
-        test_role_arn,
     ):
         """
         Test Lambda function deploys successfully.
@@ -38,120 +111,99 @@ class TestSimpleLambda:
         Verifies that a simple Lambda function can be deployed with the module
         across different provider versions, architectures, and Python versions.
 
-        :param Path test_module_dir: Temporary test module directory
-        :param Path fixtures_dir: Path to Lambda fixtures
-        :param str aws_provider_version: AWS provider version to test
+        :param dict deployed_simple_lambda: Module outputs of the shared simple Lambda variant
         :param str architecture: Lambda architecture to test
         :param str python_version: Python version to test
-        :param bool keep_after: Whether to keep resources after test
         """
-        function_name = f"test-simple-{architecture.replace('_', '')}-{python_version.replace('.', '')}"
-        lambda_source = fixtures_dir / "simple_lambda"
-
-        create_terraform_config(
-            test_module_dir,
-            lambda_source,
-            function_name,
-            "devnull@infrahouse.com",
-            aws_provider_version,
-            python_version,
-            architecture,
-            role_arn=test_role_arn,
+        function_name = variant_function_name(
+            "test-simple", architecture, python_version
         )
 
-        with terraform_apply(
-            str(test_module_dir),
-            destroy_after=not keep_after,
-            json_output=True,
-        ) as tf_output:
-            # Verify Lambda function was created
-            assert "lambda_function_arn" in tf_output
-            assert tf_output["lambda_function_arn"]["value"].startswith(
-                "arn:aws:lambda:"
-            )
-
-            # Verify function name matches
-            assert tf_output["lambda_function_name"]["value"] == function_name
-
-            # Verify CloudWatch log group was created
-            assert (
-                tf_output["cloudwatch_log_group_name"]["value"]
-                == f"/aws/lambda/{function_name}"
-            )
+        # Verify Lambda function was created
+        assert "lambda_function_arn" in deployed_simple_lambda
+        assert deployed_simple_lambda["lambda_function_arn"].startswith(
+            "arn:aws:lambda:"
+        )
 
-            # Verify S3 bucket was created
-            assert tf_output["s3_bucket_name"]["value"]
-            assert "test-simple-" in tf_output["s3_bucket_name"]["value"]
+        # Verify function name matches
+        assert deployed_simple_lambda["lambda_function_name"] == function_name
 
-            # Verify requirements file detection (should be "none" for simple lambda)
-            assert tf_output["requirements_file_used"]["value"] == "none"
+        # Verify S3 bucket was created
+        # (log group naming and requirements detection are checked at plan time
+        # in tests/unit/lambda_defaults_unit_test.tftest.hcl)
+        assert deployed_simple_lambda["s3_bucket_name"]
+        assert "test-simple-" in deployed_simple_lambda["s3_bucket_name"]
 
     def test_lambda_invocation(
         self,
-        test_module_dir,
-        fixtures_dir,
-        python_version,
+        deployed_simple_lambda,
         lambda_client,
-        keep_after,
-        test_role_arn,
     ):
         """
         Test Lambda function executes successfully.
 
         Invokes the deployed Lambda function and verifies it returns the expected response.
 
-        :param Path test_module_dir: Temporary test module directory
-        :param Path fixtures_dir: Path to Lambda fixtures
-        :param str python_version: Python version to test
+        :param dict deployed_simple_lambda: Module outputs of the shared simple Lambda variant
         :param lambda_client: Boto3 Lambda client fixture
-        :param bool keep_after: Whether to keep resources after test
         """
-        function_name = f"test-invoke-{python_version.replace('.', '')}"
-        lambda_source = fixtures_dir / "simple_lambda"
-
-        create_terraform_config(
-            test_module_dir,
-            lambda_source,
-            function_name,
-            "devnull@infrahouse.com",
-            "~> 6.0",
-            python_version,
-            role_arn=test_role_arn,
+        # Invoke Lambda function
+        status, err, payload = invoke(
+            lambda_client, deployed_simple_lambda["lambda_function_name"]
         )
 
-        with terraform_apply(
-            str(test_module_dir),
-            destroy_after=not keep_after,
-            json_output=True,
-        ) as tf_output:
-            # Invoke Lambda function
-            response = lambda_client.invoke(
-                FunctionName=tf_output["lambda_function_name"]["value"],
-                InvocationType="RequestResponse",
-                Payload=json.dumps({}),
-            )
+        # Verify successful invocation
+        assert status == 200
+        assert not err
 
-            # Verify successful invocation
-            assert response["StatusCode"] == 200
-            assert "FunctionError" not in response
+        # Verify response payload
+        assert payload["statusCode"] == 200
+        assert "Hello from Lambda!" in payload["body"]
 
-            # Parse and verify response payload
-            payload = json.loads(response["Payload"].read())
-            assert payload["statusCode"] == 200
-            assert "Hello from Lambda!" in payload["body"]
+    def test_sns_topic_creation(
+        self,
+        deployed_simple_lambda,
+        sns_client,
+    ):
+        """
+        Test SNS topic is created for alarm notifications.
 
+        Verifies that the module creates an SNS topic and email subscriptions
+        for alarm notifications. Every deployment of the module creates the
+        topic, so this needs no stack of its own.
+
+        :param dict deployed_simple_lambda: Module outputs of the shared simple Lambda variant
+        :param sns_client: Boto3 SNS client fixture
+        """
+        test_email = "devnull@infrahouse.com"
 
+        # Verify SNS topic was created
+        topic_arn = deployed_simple_lambda["sns_topic_arn"]
+        assert topic_arn
+        assert topic_arn.startswith("arn:aws:sns:")
+
+        # Verify email subscription was created (will be PendingConfirmation)
+        subscriptions = with_retry(
+            lambda: sns_client.list_subscriptions_by_topic(TopicArn=topic_arn),
+            until=lambda response: response["Subscriptions"],
+        )
+        email_subs = [
+            s for s in subscriptions["Subscriptions"] if s["Protocol"] == "email"
+        ]
+        assert len(email_subs) >= 1
+        assert any(test_email in s["Endpoint"] for s in email_subs)
+
+
+@pytest.mark.slow
+@pytest.mark.xdist_group(name="deps_lambda")
 class TestLambdaWithDependencies:
     """Test suite for Lambda function with external dependencies."""
 
     def test_dependency_packaging(
         self,
-        test_module_dir,
-        fixtures_dir,
+        deployed_deps_lambdas,
         architecture,
         python_version,
-        keep_after,
-        test_role_arn,
     ):
         """
         Test Lambda function with dependencies packages correctly.
@@ -159,47 +211,27 @@ class TestLambdaWithDependencies:
         Verifies that platform-specific dependencies (manylinux wheels) are
         properly packaged for the target architecture.
 
-        :param Path test_module_dir: Temporary test module directory
-        :param Path fixtures_dir: Path to Lambda fixtures
+        :param dict deployed_deps_lambdas: Module outputs of the shared Lambda-with-dependencies variants
         :param str architecture: Lambda architecture to test
         :param str python_version: Python version to test
-        :param bool keep_after: Whether to keep resources after test
         """
-        function_name = f"test-deps-{architecture.replace('_', '')}-{python_version.replace('.', '')}"
-        lambda_source = fixtures_dir / "lambda_with_deps"
-
-        create_terraform_config(
-            test_module_dir,
-            lambda_source,
-            function_name,
-            "devnull@infrahouse.com",
-            "~> 6.0",
-            python_version,
-            architecture,
-            role_arn=test_role_arn,
-        )
+        tf_output = deployed_deps_lambdas[
+            variant_function_name("test-deps", architecture, python_version)
+        ]
 
-        with terraform_apply(
-            str(test_module_dir),
-            destroy_after=not keep_after,
-            json_output=True,
-        ) as tf_output:
-            # Verify requirements file was detected
-            requirements_file = tf_output["requirements_file_used"]["value"]
-            assert requirements_file != "none"
-            assert "requirements.txt" in requirements_file
+        # Verify requirements file was detected
+        requirements_file = tf_output["requirements_file_used"]
+        assert requirements_file != "none"
+        assert "requirements.txt" in requirements_file
 
-            # Verify Lambda function was created successfully
-            assert tf_output["lambda_function_arn"]["value"]
+        # Verify Lambda function was created successfully
+        assert tf_output["lambda_function_arn"]
 
     def test_dependency_execution(
         self,
-        test_module_dir,
-        fixtures_dir,
+        deployed_deps_lambdas,
         architecture,
         lambda_client,
-        keep_after,
-        test_role_arn,
     ):
         """
         Test Lambda function with dependencies executes successfully.
@@ -207,50 +239,31 @@ class TestLambdaWithDependencies:
         Invokes Lambda that uses the requests library to verify dependencies
         are properly installed and functional.
 
-        :param Path test_module_dir: Temporary test module directory
-        :param Path fixtures_dir: Path to Lambda fixtures
+        :param dict deployed_deps_lambdas: Module outputs of the shared Lambda-with-dependencies variants
         :param str architecture: Lambda architecture to test
         :param lambda_client: Boto3 Lambda client fixture
-        :param bool keep_after: Whether to keep resources after test
         """
-        function_name = f"test-deps-exec-{architecture.replace('_', '')}"
-        lambda_source = fixtures_dir / "lambda_with_deps"
+        tf_output = deployed_deps_lambdas[
+            variant_function_name("test-deps", architecture, "python3.12")
+        ]
 
-        create_terraform_config(
-            test_module_dir,
-            lambda_source,
-            function_name,
-            "devnull@infrahouse.com",
-            "~> 6.0",
-            architecture=architecture,
-            role_arn=test_role_arn,
-        )
+        # Invoke Lambda function
+        status, err, payload = invoke(lambda_client, tf_output["lambda_function_name"])
 
-        with terraform_apply(
-            str(test_module_dir),
-            destroy_after=not keep_after,
-            json_output=True,
-        ) as tf_output:
-            # Invoke Lambda function
-            response = lambda_client.invoke(
-                FunctionName=tf_output["lambda_function_name"]["value"],
-                InvocationType="RequestResponse",
-                Payload=json.dumps({}),
-            )
+        # Verify successful invocation
+        assert status == 200
+        assert not err
 
-            # Verify successful invocation
-            assert response["StatusCode"] == 200
+        # Verify response payload
+        assert payload["statusCode"] == 200, f"Status code != 200 in payload: {payload}"
 
-            # Parse response
-            payload = json.loads(response["Payload"].read())
-            assert payload["statusCode"] == 200, f"Status code != 200 in payload: {payload}"
-
-            # Verify requests library worked
-            body = json.loads(payload["body"])
-            assert body["success"] is True
-            assert "requests_version" in body
+        # Verify requests library worked
+        body = orjson.loads(payload["body"])
+        assert body["success"] is True
+        assert "requests_version" in body
 
 
+@pytest.mark.slow
 class TestErrorMonitoring:
     """Test suite for CloudWatch alarm functionality."""
 
@@ -260,8 +273,9 @@ class TestErrorMonitoring:
         fixtures_dir,
         lambda_client,
         cloudwatch_client,
-        keep_after,
+        destroy_after,
         test_role_arn,
+        outputs_from_state,
     ):
         """
         Test immediate alert strategy triggers on any error.
@@ -273,7 +287,8 @@ class TestErrorMonitoring:
         :param Path fixtures_dir: Path to Lambda fixtures
         :param lambda_client: Boto3 Lambda client fixture
         :param cloudwatch_client: Boto3 CloudWatch client fixture
-        :param bool keep_after: Whether to keep resources after test
+        :param bool destroy_after: Whether to destroy resources after test
+        :param bool outputs_from_state: Read Terraform outputs from the local state file
         """
         function_name = "test-immediate-alert"
         lambda_source = fixtures_dir / "lambda_with_errors"
@@ -288,36 +303,49 @@ class TestErrorMonitoring:
             role_arn=test_role_arn,
         )
 
-        with terraform_apply(
-            str(test_module_dir),
-            destroy_after=not keep_after,
-            json_output=True,
+        with apply_module(
+            test_module_dir, destroy_after, outputs_from_state
         ) as tf_output:
+            function_name_output = tf_output["lambda_function_name"]["value"]
+
             # Invoke Lambda without error first (should succeed)
-            response = lambda_client.invoke(
-                FunctionName=tf_output["lambda_function_name"]["value"],
-                InvocationType="RequestResponse",
-                Payload=json.dumps({"force_error": False}),
+            status, _, _ = invoke(
+                lambda_client, function_name_output, {"force_error": False}
             )
-            assert response["StatusCode"] == 200
+            assert status == 200
 
             # Now invoke with error
-            response = lambda_client.invoke(
-                FunctionName=tf_output["lambda_function_name"]["value"],
-                InvocationType="RequestResponse",
-                Payload=json.dumps({"force_error": True}),
+            _, err, _ = invoke(
+                lambda_client, function_name_output, {"force_error": True}
             )
-            assert "FunctionError" in response
+            assert err
 
-            # Wait for alarm to update (CloudWatch alarms evaluate every 60 seconds)
+            # Wait for alarm to update (CloudWatch alarms evaluate every 60 seconds).
+            # Poll with backoff and stop as soon as the alarm fires; give up after
+            # the 90 seconds the test used to sleep unconditionally.
             alarm_name = f"{function_name}-errors-immediate"
-            time.sleep(90)  # Wait for alarm evaluation
+            deadline = time.monotonic() + 90
+            delay = 5
+            while True:
+                alarms = cloudwatch_client.describe_alarms(
+                    AlarmNames=[alarm_name], AlarmTypes=["MetricAlarm"], MaxRecords=1
+                )
+                alarm_state = (
+                    alarms["MetricAlarms"][0]["StateValue"]
+                    if alarms["MetricAlarms"]
+                    else None
+                )
+                if alarm_state == "ALARM" or time.monotonic() >= deadline:
+                    break
+                LOG.info(
+                    "Alarm %s is %s, waiting %s seconds", alarm_name, alarm_state, delay
+                )
+                time.sleep(min(delay, max(0, deadline - time.monotonic())))
+                delay = min(delay * 1.5, 20)
 
             # Check alarm state
-            alarms = cloudwatch_client.describe_alarms(AlarmNames=[alarm_name])
             assert len(alarms["MetricAlarms"]) == 1
             # Note: Alarm may be in ALARM or INSUFFICIENT_DATA state depending on timing
-            alarm_state = alarms["MetricAlarms"][0]["StateValue"]
             assert alarm_state in ["ALARM", "INSUFFICIENT_DATA"]
 
     def test_threshold_alert_strategy(
@@ -325,8 +353,9 @@ class TestErrorMonitoring:
         test_module_dir,
         fixtures_dir,
         lambda_client,
-        keep_after,
+        destroy_after,
         test_role_arn,
+        outputs_from_state,
     ):
         """
         Test threshold alert strategy requires multiple errors.
@@ -337,7 +366,8 @@ class TestErrorMonitoring:
         :param Path test_module_dir: Temporary test module directory
         :param Path fixtures_dir: Path to Lambda fixtures
         :param lambda_client: Boto3 Lambda client fixture
-        :param bool keep_after: Whether to keep resources after test
+        :param bool destroy_after: Whether to destroy resources after test
+        :param bool outputs_from_state: Read Terraform outputs from the local state file
         """
         function_name = "test-threshold-alert"
         lambda_source = fixtures_dir / "lambda_with_errors"
@@ -352,21 +382,27 @@ class TestErrorMonitoring:
             role_arn=test_role_arn,
         )
 
-        with terraform_apply(
-            str(test_module_dir),
-            destroy_after=not keep_after,
-            json_output=True,
+        with apply_module(
+            test_module_dir, destroy_after, outputs_from_state
         ) as tf_output:
             function_name_output = tf_output["lambda_function_name"]["value"]
 
             # Invoke multiple times: some successes, some failures
-            # To trigger a 5% error rate alarm, we need enough invocations
-            for i in range(10):
-                force_error = i < 2  # First 2 will error (20% error rate)
-                lambda_client.invoke(
-                    FunctionName=function_name_output,
-                    InvocationType="RequestResponse",
-                    Payload=json.dumps({"force_error": force_error}),
+            # To trigger a 5% error rate alarm, we need enough invocations.
+            # Invocations run concurrently; they stay synchronous so each one is
+            # counted exactly once (async invocations are retried on error).
+            payloads = [
+                {"force_error": i < 2}  # First 2 will error (20% error rate)
+                for i in range(10)
+            ]
+            with ThreadPoolExecutor(max_workers=len(payloads)) as executor:
+                list(
+                    executor.map(
+                        lambda payload: invoke(
+                            lambda_client, function_name_output, payload
+                        ),
+                        payloads,
+                    )
                 )
 
             # Verify alarm was created
@@ -374,60 +410,7 @@ class TestErrorMonitoring:
             assert "threshold" in tf_output["error_alarm_arn"]["value"]
 
 
-class TestSNSIntegration:
-    """Test suite for SNS topic and email subscription."""
-
-    def test_sns_topic_creation(
-        self,
-        test_module_dir,
-        fixtures_dir,
-        sns_client,
-        keep_after,
-        test_role_arn,
-    ):
-        """
-        Test SNS topic is created for alarm notifications.
-
-        Verifies that the module creates an SNS topic and email subscriptions
-        for alarm notifications.
-
-        :param Path test_module_dir: Temporary test module directory
-        :param Path fixtures_dir: Path to Lambda fixtures
-        :param sns_client: Boto3 SNS client fixture
-        :param bool keep_after: Whether to keep resources after test
-        """
-        function_name = "test-sns-topic"
-        lambda_source = fixtures_dir / "simple_lambda"
-        test_email = "devnull@infrahouse.com"
-
-        create_terraform_config(
-            test_module_dir,
-            lambda_source,
-            function_name,
-            test_email,
-            "~> 6.0",
-            role_arn=test_role_arn,
-        )
-
-        with terraform_apply(
-            str(test_module_dir),
-            destroy_after=not keep_after,
-            json_output=True,
-        ) as tf_output:
-            # Verify SNS topic was created
-            topic_arn = tf_output["sns_topic_arn"]["value"]
-            assert topic_arn
-            assert topic_arn.startswith("arn:aws:sns:")
-
-            # Verify email subscription was created (will be PendingConfirmation)
-            subscriptions = sns_client.list_subscriptions_by_topic(TopicArn=topic_arn)
-            email_subs = [
-                s for s in subscriptions["Subscriptions"] if s["Protocol"] == "email"
-            ]
-            assert len(email_subs) >= 1
-            assert any(test_email in s["Endpoint"] for s in email_subs)
-
-
+@pytest.mark.slow
 class TestMemoryMonitoring:
     """Test suite for the Lambda Insights-backed memory utilization alarm."""
 
@@ -437,8 +420,9 @@ class TestMemoryMonitoring:
         fixtures_dir,
         lambda_client,
         cloudwatch_client,
-        keep_after,
+        destroy_after,
         test_role_arn,
+        outputs_from_state,
     ):
         """
         Test that setting memory_utilization_threshold_percent provisions:
@@ -451,8 +435,9 @@ class TestMemoryMonitoring:
         :param Path fixtures_dir: Path to Lambda fixtures
         :param lambda_client: Boto3 Lambda client fixture
         :param cloudwatch_client: Boto3 CloudWatch client fixture
-        :param bool keep_after: Whether to keep resources after test
+        :param bool destroy_after: Whether to destroy resources after test
         :param str test_role_arn: IAM role ARN for testing
+        :param bool outputs_from_state: Read Terraform outputs from the local state file
         """
         function_name = "test-memory-alarm"
         lambda_source = fixtures_dir / "simple_lambda"
@@ -467,10 +452,8 @@ class TestMemoryMonitoring:
             memory_utilization_threshold_percent=80,
         )
 
-        with terraform_apply(
-            str(test_module_dir),
-            destroy_after=not keep_after,
-            json_output=True,
+        with apply_module(
+            test_module_dir, destroy_after, outputs_from_state
         ) as tf_output:
             # The module should have created the memory alarm.
             memory_alarm_arn = tf_output["memory_alarm_arn"]["value"]
@@ -484,7 +467,9 @@ class TestMemoryMonitoring:
 
             # Verify the alarm exists in CloudWatch with the expected metric/threshold.
             alarm_name = f"{function_name}-memory"
-            alarms = cloudwatch_client.describe_alarms(AlarmNames=[alarm_name])
+            alarms = cloudwatch_client.describe_alarms(
+                AlarmNames=[alarm_name], AlarmTypes=["MetricAlarm"], MaxRecords=1
+            )
             assert len(alarms["MetricAlarms"]) == 1
             alarm = alarms["MetricAlarms"][0]
             assert alarm["Namespace"] == "LambdaInsights"
@@ -504,13 +489,9 @@ class TestMemoryMonitoring:
             # Invoke the function a few times so Lambda Insights has something to publish.
             function_name_value = tf_output["lambda_function_name"]["value"]
             for _ in range(3):
-                invoke_response = lambda_client.invoke(
-                    FunctionName=function_name_value,
-                    InvocationType="RequestResponse",
-                    Payload=json.dumps({}),
-                )
-                assert invoke_response["StatusCode"] == 200
-                assert "FunctionError" not in invoke_response
+                status, err, _ = invoke(lambda_client, function_name_value)
+                assert status == 200
+                assert not err
 
             # Poll the LambdaInsights namespace for the memory_utilization metric.
             # Lambda Insights publishes on invocation, but CloudWatch GetMetricStatistics can
@@ -560,6 +541,10 @@ class TestMemoryMonitoring:
             )
 
 
+# service_network is a session fixture applied from a shared directory inside
+# pytest-infrahouse, so every test that uses it must run on the same xdist worker.
+@pytest.mark.slow
+@pytest.mark.xdist_group(name="service_network")
 class TestVPCIntegration:
     """Test suite for VPC Lambda integration and IAM permissions."""
 
@@ -569,8 +554,9 @@ class TestVPCIntegration:
         fixtures_dir,
         service_network,
         lambda_client,
-        keep_after,
+        destroy_after,
         test_role_arn,
+        outputs_from_state,
     ):
         """
         Test Lambda deployment and execution within VPC.
@@ -586,8 +572,9 @@ class TestVPCIntegration:
         :param Path fixtures_dir: Path to Lambda fixtures
         :param dict service_network: Service network fixture from pytest-infrahouse
         :param lambda_client: Boto3 Lambda client fixture
-        :param bool keep_after: Whether to keep resources after test
+        :param bool destroy_after: Whether to destroy resources after test
         :param str test_role_arn: IAM role ARN for testing
+        :param bool outputs_from_state: Read Terraform outputs from the local state file
         """
         function_name = "test-vpc-lambda"
         lambda_source = fixtures_dir / "simple_lambda"
@@ -611,10 +598,8 @@ class TestVPCIntegration:
             role_arn=test_role_arn,
         )
 
-        with terraform_apply(
-            str(test_module_dir),
-            destroy_after=not keep_after,
-            json_output=True,
+        with apply_module(
+            test_module_dir, destroy_after, outputs_from_state
         ) as tf_output:
             # Verify Lambda was created with VPC configuration
             assert tf_output["lambda_function_arn"]["value"]
@@ -636,18 +621,15 @@ class TestVPCIntegration:
             LOG.info(
                 "Invoking Lambda to test VPC ENI creation with scoped IAM permissions..."
             )
-            response = lambda_client.invoke(
-                FunctionName=tf_output["lambda_function_name"]["value"],
-                InvocationType="RequestResponse",
-                Payload=json.dumps({}),
+            status, err, payload = invoke(
+                lambda_client, tf_output["lambda_function_name"]["value"]
             )
 
             # Verify successful invocation (proves ENI was created successfully)
-            assert response["StatusCode"] == 200
-            assert "FunctionError" not in response
+            assert status == 200
+            assert not err
 
-            # Parse and verify response payload
-            payload = json.loads(response["Payload"].read())
+            # Verify response payload
             assert payload["statusCode"] == 200
             assert "Hello from Lambda!" in payload["body"]
 
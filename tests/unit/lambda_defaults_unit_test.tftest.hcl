@@ -0,0 +1,88 @@
+# Plan-only checks of values Terraform knows before apply.
+# Runs against a mocked AWS provider, so no credentials or resources are needed:
+#   terraform test -test-directory=tests/unit
+
+mock_provider "aws" {
+  mock_data "aws_iam_policy_document" {
+    defaults = {
+      json = "{\"Version\":\"2012-10-17\",\"Statement\":[]}"
+    }
+  }
+
+  mock_data "aws_region" {
+    defaults = {
+      name = "us-west-2"
+    }
+  }
+}
+
+variables {
+  function_name     = "test-simple-unit"
+  lambda_source_dir = "./tests/fixtures/simple_lambda"
+  alarm_emails      = ["devnull@infrahouse.com"]
+}
+
+run "simple_lambda_defaults" {
+  command = plan
+
+  assert {
+    condition     = aws_lambda_function.this.function_name == var.function_name
+    error_message = "Lambda function name does not match var.function_name"
+  }
+
+  assert {
+    condition     = aws_lambda_function.this.runtime == "python3.12"
+    error_message = "Lambda runtime does not default to python3.12"
+  }
+
+  assert {
+    condition     = aws_lambda_function.this.architectures == tolist(["x86_64"])
+    error_message = "Lambda architecture does not default to x86_64"
+  }
+
+  assert {
+    condition     = aws_cloudwatch_log_group.lambda.name == "/aws/lambda/${var.function_name}"
+    error_message = "CloudWatch log group name does not follow /aws/lambda/<function_name>"
+  }
+
+  assert {
+    condition     = output.requirements_file_used == "none"
+    error_message = "Simple Lambda must not use a requirements file"
+  }
+
+  assert {
+    condition     = length(aws_cloudwatch_metric_alarm.errors_immediate) == 1 && length(aws_cloudwatch_metric_alarm.errors_threshold) == 0
+    error_message = "Immediate alert strategy must create only the immediate error alarm"
+  }
+
+  assert {
+    condition     = output.lambda_insights_layer_arn == null
+    error_message = "Lambda Insights must be disabled unless memory_utilization_threshold_percent is set"
+  }
+}
+
+run "threshold_alert_strategy" {
+  command = plan
+
+  variables {
+    alert_strategy = "threshold"
+  }
+
+  assert {
+    condition     = length(aws_cloudwatch_metric_alarm.errors_immediate) == 0 && length(aws_cloudwatch_metric_alarm.errors_threshold) == 1
+    error_message = "Threshold alert strategy must create only the threshold error alarm"
+  }
+}
+
+run "lambda_with_deps_requirements" {
+  command = plan
+
+  variables {
+    lambda_source_dir = "./tests/fixtures/lambda_with_deps"
+  }
+
+  assert {
+    condition     = endswith(output.requirements_file_used, "requirements.txt")
+    error_message = "requirements.txt in lambda_source_dir was not detected"
+  }
+}